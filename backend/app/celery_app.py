@@ -0,0 +1,55 @@
+"""
+Celery application and tasks - runs analyses outside the API process
+
+Start a worker from the backend directory with:
+    celery -A app.celery_app worker -Q analysis --concurrency=8
+"""
+
+import asyncio
+from typing import Optional
+from celery import Celery
+from app.config import settings
+from app.services.analysis_service import get_analysis_service
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ANALYSIS_QUEUE = "analysis"
+
+celery_app = Celery(
+    "biasscope",
+    broker=settings.celery_broker_url or settings.redis_url,
+    backend=settings.celery_result_backend or settings.redis_url,
+)
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    task_routes={"run_analysis": {"queue": ANALYSIS_QUEUE}},
+    # An analysis runs for a while; hand a worker one at a time so a long
+    # job never holds others back in its prefetch buffer.
+    worker_prefetch_multiplier=1,
+    task_track_started=True,
+)
+
+# Each worker process keeps one event loop for its whole life, so the Motor
+# client and HTTP client cached per loop are reused across tasks.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return this worker process's event loop, creating it on first use"""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+@celery_app.task(name="run_analysis", bind=True, acks_late=True)
+def run_analysis_task(self, analysis_id: str, model_url: str) -> None:
+    """Run one analysis end to end; the task ID is the analysis ID"""
+    logger.info(f"Worker picked up analysis {analysis_id}")
+    _get_worker_loop().run_until_complete(
+        get_analysis_service().run_analysis(analysis_id=analysis_id, model_url=model_url)
+    )
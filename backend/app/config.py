@@ -2,7 +2,8 @@
 Configuration settings for BiasScope Backend
 """
 
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 import os
 
@@ -13,10 +14,26 @@ class Settings(BaseSettings):
     # MongoDB settings
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_database: str = "biasscope"
+    mongo_max_pool_size: int = 200
+    mongo_min_pool_size: int = 10
+    mongo_max_idle_ms: int = 300000
+    mongo_max_connecting: int = 4
+    mongo_server_selection_timeout_ms: int = 5000
 
-    # Redis settings (for Celery if needed)
+    # User lookups are cached in-process for this long
+    user_cache_ttl_seconds: int = 30
+    user_cache_max_size: int = 10000
+
+    # Redis settings (Celery broker and result backend by default)
     redis_url: str = "redis://localhost:6379/0"
 
+    # Task queue settings. By default analyses run inside the API process;
+    # enable the queue (USE_TASK_QUEUE=true) to run them on Celery workers,
+    # which needs Redis and at least one running worker.
+    use_task_queue: bool = False
+    celery_broker_url: Optional[str] = None
+    celery_result_backend: Optional[str] = None
+
     # Analysis settings
     # Keep this modest by default so local runs don't feel "stuck" on progress.
     # Override via .env (SYNTHETIC_DATA_SIZE=...)
@@ -25,17 +42,41 @@ class Settings(BaseSettings):
 
     # Model API settings
     model_request_timeout: int = 30
+    # Fail fast on unreachable hosts instead of waiting the full request timeout
+    model_connect_timeout: int = 5
+    # Open (and kept-alive) connections shared by all analyses in this process
+    model_max_connections: int = 200
     model_max_retries: int = 3
+    model_max_concurrency: int = 10
+    # Opt-in: inputs sent per request to the model's batch endpoint
+    # (<model_url>_batch, e.g. /predict_batch). Only enable it for models
+    # that serve one; 0 (the default) sends one request per input
+    model_batch_size: int = 0
 
     # Report settings - Use absolute path
     reports_directory: str = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../reports"))
+    report_render_workers: int = 2
+
+    # Threads available to sync dependencies and file responses in the API
+    worker_thread_limit: int = 100
 
     # Logging
     log_level: str = "INFO"
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        # Fields like model_request_timeout refer to the user's AI model,
+        # not pydantic's model_ namespace.
+        protected_namespaces=("settings_",),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading .env only once"""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
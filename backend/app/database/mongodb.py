@@ -2,37 +2,104 @@
 MongoDB database connection and utilities
 """
 
-from typing import Optional
-from motor.motor_asyncio import AsyncIOMotorClient
-from app.config import settings
+import asyncio
+from typing import Dict, Optional
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.collation import Collation, CollationStrength
+from app.config import get_settings
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-# Global database client
-client: Optional[AsyncIOMotorClient] = None
-database = None
+# Motor clients are bound to the event loop that created them, so keep one
+# database handle per loop. The API process only ever has one loop; scripts
+# and workers that spin up their own loop get their own client.
+_databases: Dict[asyncio.AbstractEventLoop, AsyncIOMotorDatabase] = {}
 
+# Database handle for the application loop, set on startup
+db: Optional[AsyncIOMotorDatabase] = None
+
+# Emails and usernames compare case-insensitively. Queries on those fields
+# must pass this collation to match (and use) the unique indexes below.
+USER_COLLATION = Collation(locale="en", strength=CollationStrength.SECONDARY)
+
+
+async def connect_to_database() -> AsyncIOMotorDatabase:
+    """Create the MongoDB client for the running event loop"""
+    global db
+
+    loop = asyncio.get_running_loop()
+    database = _databases.get(loop)
+    if database is not None:
+        return database
+
+    settings = get_settings()
+    try:
+        client = AsyncIOMotorClient(
+            settings.mongodb_url,
+            maxPoolSize=settings.mongo_max_pool_size,
+            minPoolSize=settings.mongo_min_pool_size,
+            maxIdleTimeMS=settings.mongo_max_idle_ms,
+            maxConnecting=settings.mongo_max_connecting,
+            serverSelectionTimeoutMS=settings.mongo_server_selection_timeout_ms,
+            retryWrites=True,
+            io_loop=loop,
+        )
+        # Motor connects lazily; ping once so the pool starts warming
+        # towards minPoolSize before the first real request.
+        await client.admin.command("ping")
+        database = client[settings.mongodb_database]
+        logger.info(f"Connected to MongoDB database: {settings.mongodb_database}")
+    except Exception as e:
+        logger.error(f"Failed to connect to MongoDB: {str(e)}")
+        raise
+
+    _databases[loop] = database
+    if db is None:
+        db = database
+    return database
 
-async def get_database():
-    """Get MongoDB database instance"""
-    global client, database
 
-    if database is None:
+async def ensure_indexes(database: AsyncIOMotorDatabase) -> None:
+    """Create the indexes backing the hot user and analysis queries"""
+    indexes = [
+        (database.users, "user_id", {"unique": True}),
+        (database.users, "email", {"unique": True, "collation": USER_COLLATION}),
+        (database.users, "username", {"unique": True, "collation": USER_COLLATION}),
+        (database.analyses, "analysis_id", {"unique": True}),
+        (database.analyses, [("created_at", -1)], {}),
+        # Status lookups: completed analyses for report regeneration, and
+        # most recently touched analyses in a given state
+        (database.analyses, [("status", 1), ("updated_at", -1)], {}),
+    ]
+    # Each index is created on its own, so one that can't be built (e.g. a
+    # unique index over existing duplicates) doesn't take the rest with it
+    failed = 0
+    for collection, keys, options in indexes:
         try:
-            client = AsyncIOMotorClient(settings.mongodb_url)
-            database = client[settings.mongodb_database]
-            logger.info(f"Connected to MongoDB database: {settings.mongodb_database}")
+            await collection.create_index(keys, background=True, **options)
         except Exception as e:
-            logger.error(f"Failed to connect to MongoDB: {str(e)}")
-            raise
+            failed += 1
+            logger.error(f"Failed to create index {keys} on {collection.name}: {str(e)}")
+    if not failed:
+        logger.info("MongoDB indexes ensured")
 
-    return database
+
+async def get_database() -> AsyncIOMotorDatabase:
+    """Get MongoDB database instance"""
+    try:
+        return _databases[asyncio.get_running_loop()]
+    except KeyError:
+        return await connect_to_database()
 
 
 async def close_database():
-    """Close MongoDB connection"""
-    global client
-    if client:
-        client.close()
+    """Close MongoDB connection for the running event loop"""
+    global db
+
+    database = _databases.pop(asyncio.get_running_loop(), None)
+    if database is not None:
+        database.client.close()
+        if database is db:
+            db = None
         logger.info("MongoDB connection closed")
@@ -0,0 +1,213 @@
+"""
+Repositories wrapping the analyses and users collections
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument, WriteConcern
+from app.database.mongodb import get_database, USER_COLLATION
+
+# Progress-only updates are superseded within seconds and harmless to lose
+# on a crash, so they skip the journal wait. Everything else keeps the
+# client's default write concern.
+PROGRESS_WRITE_CONCERN = WriteConcern(w=1, j=False)
+PROGRESS_ONLY_FIELDS = frozenset({"progress"})
+
+# Streamed model outputs are flushed to the document in chunks of this size
+# as predictions come back, rather than one update per prediction.
+PUSH_BATCH_SIZE = 25
+
+# The raw test data is only needed while an analysis runs; listings and
+# report generation skip it.
+LIST_PROJECTION = {
+    "synthetic_inputs": 0,
+    "model_outputs": 0,
+    "results.explainability_insights": 0,
+}
+
+# Only the most recent saved analyses are kept on the user document so it
+# stays small no matter how many reports a user downloads.
+ANALYSIS_HISTORY_LIMIT = 50
+
+LOGIN_PROJECTION = {
+    "user_id": 1,
+    "email": 1,
+    "username": 1,
+    "full_name": 1,
+    "profession": 1,
+    "profile_photo": 1,
+    "password_hash": 1,
+    "is_active": 1,
+}
+USER_PROJECTION = {"password_hash": 0}
+PROFILE_PROJECTION = {"password_hash": 0, "analysis_history": 0}
+
+
+class AnalysisRepo:
+    """Queries and writes against the analyses collection"""
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.database = database
+        self.coll = database.analyses
+        self.progress_coll = database.get_collection(
+            "analyses", write_concern=PROGRESS_WRITE_CONCERN
+        )
+
+    async def insert(self, document: Dict[str, Any]) -> None:
+        """Insert a new analysis document"""
+        await self.coll.insert_one(document)
+
+    async def find(
+        self, analysis_id: str, projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Find one analysis by ID"""
+        return await self.coll.find_one({"analysis_id": analysis_id}, projection)
+
+    async def set_fields(self, analysis_id: str, updates: Dict[str, Any]) -> None:
+        """Set fields on an analysis, stamping updated_at"""
+        coll = self.progress_coll if updates.keys() <= PROGRESS_ONLY_FIELDS else self.coll
+        updates = {**updates, "updated_at": datetime.now(timezone.utc)}
+        await coll.update_one({"analysis_id": analysis_id}, {"$set": updates})
+
+    async def push(
+        self,
+        analysis_id: str,
+        field: str,
+        items: List[Dict[str, Any]],
+        updates: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Append items to an array field, optionally setting fields"""
+        # One update, so the server rewrites the document once per call. A
+        # bare push still changes the document, so it stamps updated_at too;
+        # the polling ETag is built from it.
+        updates = {**(updates or {}), "updated_at": datetime.now(timezone.utc)}
+        await self.coll.update_one(
+            {"analysis_id": analysis_id},
+            {"$push": {field: {"$each": items}}, "$set": updates},
+        )
+
+    async def list_recent(
+        self,
+        limit: int,
+        skip: int = 0,
+        before: Optional[datetime] = None,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """List analyses newest first, without the raw test data"""
+        query = {"created_at": {"$lt": before}} if before else {}
+        cursor = (
+            self.coll.find(query, projection or LIST_PROJECTION)
+            .sort("created_at", -1)
+            .skip(skip)
+            .limit(limit)
+        )
+        return await cursor.to_list(length=limit)
+
+
+class UserRepo:
+    """Queries and writes against the users collection"""
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.database = database
+        self.coll = database.users
+
+    async def insert(self, document: Dict[str, Any]) -> None:
+        """Insert a new user; raises DuplicateKeyError on a taken email or username"""
+        await self.coll.insert_one(document)
+
+    async def find_for_login(self, email: str) -> Optional[Dict[str, Any]]:
+        """Find a user by email (case-insensitive) with the login fields"""
+        return await self.coll.find_one(
+            {"email": email}, LOGIN_PROJECTION, collation=USER_COLLATION
+        )
+
+    async def find(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Find a user by ID without the password hash"""
+        return await self.coll.find_one({"user_id": user_id}, USER_PROJECTION)
+
+    async def update_profile(
+        self, user_id: str, updates: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Set profile fields and return the updated profile"""
+        updates = {**updates, "updated_at": datetime.now(timezone.utc)}
+        return await self.coll.find_one_and_update(
+            {"user_id": user_id},
+            {"$set": updates},
+            projection=PROFILE_PROJECTION,
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def push_history(self, user_id: str, record: Dict[str, Any]) -> bool:
+        """Append to the capped analysis history; True if the user was updated"""
+        result = await self.coll.update_one(
+            {"user_id": user_id},
+            {
+                "$push": {
+                    "analysis_history": {
+                        "$each": [record],
+                        "$slice": -ANALYSIS_HISTORY_LIMIT,
+                    }
+                },
+                "$set": {"updated_at": datetime.now(timezone.utc)},
+            },
+        )
+        return result.modified_count > 0
+
+    async def pull_history(self, user_id: str, analysis_id: str) -> bool:
+        """Remove one analysis from the history; True if it was removed"""
+        result = await self.coll.update_one(
+            {"user_id": user_id},
+            {
+                "$pull": {"analysis_history": {"analysis_id": analysis_id}},
+                "$set": {"updated_at": datetime.now(timezone.utc)},
+            },
+        )
+        return result.modified_count > 0
+
+    async def history_page(
+        self, user_id: str, limit: int, skip: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Return a page of the user's analysis history, newest first"""
+        skip = max(skip, 0)
+        if limit <= 0:
+            return []
+        # New entries are pushed to the end, so fetch only the newest
+        # skip + limit (or all, if there are fewer) and page from the end
+        user = await self.coll.find_one(
+            {"user_id": user_id},
+            {"analysis_history": {"$slice": -(skip + limit)}, "_id": 0},
+        )
+        history = user.get("analysis_history", []) if user else []
+        return history[::-1][skip:skip + limit]
+
+
+# Repositories are bound to a database handle, which is bound to its event
+# loop, so they are cached per loop alongside the handles in mongodb.py.
+_repositories: Dict[asyncio.AbstractEventLoop, Tuple[AnalysisRepo, UserRepo]] = {}
+
+
+def init_repositories(database: AsyncIOMotorDatabase) -> Tuple[AnalysisRepo, UserRepo]:
+    """Build the repositories for the running event loop's database"""
+    repos = (AnalysisRepo(database), UserRepo(database))
+    _repositories[asyncio.get_running_loop()] = repos
+    return repos
+
+
+async def _get_repositories() -> Tuple[AnalysisRepo, UserRepo]:
+    database = await get_database()
+    repos = _repositories.get(asyncio.get_running_loop())
+    if repos is None or repos[0].database is not database:
+        repos = init_repositories(database)
+    return repos
+
+
+async def get_analysis_repo() -> AnalysisRepo:
+    """Get the analyses repository for the running event loop"""
+    return (await _get_repositories())[0]
+
+
+async def get_user_repo() -> UserRepo:
+    """Get the users repository for the running event loop"""
+    return (await _get_repositories())[1]
@@ -0,0 +1,294 @@
+"""
+Analysis endpoints - start analyses, poll their results and download reports
+"""
+
+import asyncio
+import hashlib
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+import msgspec
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response
+from fastapi.responses import FileResponse, ORJSONResponse
+
+from app.config import settings
+from app.celery_app import run_analysis_task
+from app.services.analysis_service import VERSION_PROJECTION, get_analysis_service
+from app.utils.http import decode_body, json_response
+from app.utils.ids import new_uuid
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+router = APIRouter()
+
+
+URL_SCHEMES = ("http://", "https://")
+
+# The only accepted shape: [http(s)://]host[:port][/path], where host is a
+# name, IPv4 address or bracketed IPv6 literal. There is no userinfo, so no
+# credentials, and no other scheme; a scheme-less host may not itself be
+# "http"/"https" (e.g. "http:5000" or "https:/x")
+MODEL_URL_RE = re.compile(
+    r"(?:(https?)://|(?!https?:))"
+    r"(?:[A-Za-z0-9.-]+|\[[0-9A-Fa-f:.]+\])"
+    r"(?::\d{1,5})?"
+    r"(?:[/?#]\S*)?",
+    re.IGNORECASE,
+)
+
+# Rejections are built once; bots hammering /analysis/start with bad URLs
+# shouldn't cost a fresh exception and message per request
+_ERR_URL_REQUIRED = ValueError("model_url is required")
+_ERR_URL_SCHEME = ValueError("model_url must start with http:// or https:// (or omit the scheme)")
+_ERR_URL_INVALID = ValueError("model_url must be a URL like http://localhost:5000/predict")
+
+
+def _reject(error: ValueError) -> ValueError:
+    """Hand back a shared error with the traceback of its last raise dropped"""
+    return error.with_traceback(None)
+
+
+# Users resubmit the same handful of model URLs, so repeats are a cache hit
+@lru_cache(maxsize=4096)
+def normalize_model_url(v: str) -> str:
+    """
+    Accept http/https URLs and also scheme-less inputs like:
+    - localhost:5000/predict
+    - 127.0.0.1:8000/predict
+    - example.com/predict
+
+    If scheme is missing, default to http://
+    """
+    v = v.strip()
+    if not v:
+        raise _reject(_ERR_URL_REQUIRED)
+
+    match = MODEL_URL_RE.fullmatch(v)
+    if match:
+        return v if match.group(1) else f"http://{v}"
+
+    if "://" in v and not v[:8].lower().startswith(URL_SCHEMES):
+        raise _reject(_ERR_URL_SCHEME)
+    raise _reject(_ERR_URL_INVALID)
+
+
+# The hot, tiny payloads are msgspec Structs decoded straight from the
+# request body, which skips Pydantic validation and jsonable_encoder.
+class AnalysisRequest(msgspec.Struct):
+    model_url: str
+
+    def __post_init__(self):
+        # A ValueError here surfaces as a msgspec.ValidationError
+        self.model_url = normalize_model_url(self.model_url)
+
+
+class AnalysisResponse(msgspec.Struct):
+    analysis_id: str
+    status: str
+    message: str
+
+
+@router.post("/analysis/start")
+async def start_analysis(
+    http_request: Request, background_tasks: BackgroundTasks
+):
+    """
+    Start a new bias analysis for the provided AI model API
+    """
+    request = await decode_body(http_request, AnalysisRequest)
+    try:
+        analysis_id = new_uuid()
+        analysis_service = get_analysis_service()
+
+        # Store initial analysis record
+        await analysis_service.create_analysis(
+            analysis_id=analysis_id,
+            model_url=str(request.model_url),
+        )
+
+        if settings.use_task_queue:
+            # Hand the analysis to a Celery worker; the task ID doubles as the
+            # analysis ID. Publishing talks to the broker, so keep it off the
+            # event loop.
+            try:
+                await asyncio.to_thread(
+                    run_analysis_task.apply_async,
+                    args=[analysis_id, str(request.model_url)],
+                    task_id=analysis_id,
+                )
+            except Exception as e:
+                # Nothing will ever pick this analysis up, so don't leave
+                # it looking "started" to pollers
+                await analysis_service.update_analysis(
+                    analysis_id,
+                    {"status": "failed", "error_message": f"Failed to queue analysis: {str(e)}"},
+                )
+                raise
+        else:
+            # Start analysis in background
+            background_tasks.add_task(
+                analysis_service.run_analysis,
+                analysis_id=analysis_id,
+                model_url=str(request.model_url),
+            )
+
+        logger.info(f"Started analysis {analysis_id} for model {request.model_url}")
+
+        return json_response(AnalysisResponse(
+            analysis_id=analysis_id,
+            status="started",
+            message="Analysis started successfully",
+        ))
+    except Exception as e:
+        logger.error(f"Error starting analysis: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to start analysis: {str(e)}")
+
+
+# Pollers revalidate on every request, so an unchanged analysis costs a
+# 304 instead of a full document.
+POLL_CACHE_HEADERS = {"Cache-Control": "no-cache"}
+
+# Reports are rewritten in place when regenerated, so browsers keep their
+# copy but revalidate it rather than treating it as immutable
+REPORT_CACHE_HEADERS = {"Cache-Control": "private, no-cache"}
+
+
+def _compute_etag(versions) -> str:
+    """Build a strong ETag from (analysis_id, status, updated_at) versions"""
+    digest = hashlib.blake2b(digest_size=8)
+    for version in versions:
+        digest.update(
+            f"{version.get('analysis_id')}:{version.get('status')}:{version.get('updated_at')};".encode()
+        )
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match already names this ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+@router.get("/analysis/{analysis_id}")
+async def get_analysis_results(analysis_id: str, request: Request):
+    """
+    Get analysis results by analysis ID
+    """
+    try:
+        analysis_service = get_analysis_service()
+
+        # Check the version first so an unchanged analysis never loads its
+        # results from MongoDB.
+        version = await analysis_service.get_analysis(analysis_id, VERSION_PROJECTION)
+        if not version:
+            raise HTTPException(status_code=404, detail="Analysis not found")
+
+        etag = _compute_etag([version])
+        headers = {"ETag": etag, **POLL_CACHE_HEADERS}
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+
+        results = await analysis_service.get_analysis(analysis_id)
+        if not results:
+            raise HTTPException(status_code=404, detail="Analysis not found")
+
+        # Analysis documents are plain BSON-decoded dicts, so hand them
+        # straight to orjson instead of walking them with jsonable_encoder.
+        return ORJSONResponse(results, headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching analysis {analysis_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch analysis: {str(e)}")
+
+
+@router.get("/analysis/{analysis_id}/report")
+async def download_report(analysis_id: str, request: Request):
+    """
+    Download analysis report as PDF
+    """
+    try:
+        import os
+        
+        analysis_service = get_analysis_service()
+        report_path = await analysis_service.generate_report(analysis_id)
+
+        if not report_path:
+            raise HTTPException(status_code=404, detail="Report not found or not ready")
+
+        # Check the file exists and is not empty with a single stat, off the
+        # event loop since the reports directory may be on slow storage
+        try:
+            stat_result = await asyncio.to_thread(os.stat, report_path)
+        except FileNotFoundError:
+            logger.error(f"Report file not found at: {report_path}")
+            raise HTTPException(status_code=404, detail=f"Report file not found at {report_path}")
+
+        if stat_result.st_size == 0:
+            logger.error(f"Report file is empty: {report_path}")
+            raise HTTPException(status_code=500, detail="Report file is empty")
+
+        # The file only changes when the report is regenerated, which also
+        # changes its mtime, so size + mtime make a cheap strong validator
+        etag = f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+        headers = {"ETag": etag, **REPORT_CACHE_HEADERS}
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+
+        # Passing the stat result lets FileResponse set Content-Length and
+        # Last-Modified without statting the file again
+        return FileResponse(
+            report_path,
+            media_type="application/pdf",
+            filename=f"biasscope-report-{analysis_id}.pdf",
+            headers=headers,
+            stat_result=stat_result,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error generating report for {analysis_id}: {str(e)}")
+        import traceback
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        raise HTTPException(status_code=500, detail=f"Failed to generate report: {str(e)}")
+
+
+@router.get("/analyses")
+async def list_analyses(
+    request: Request,
+    limit: int = 10,
+    skip: int = 0,
+    before: Optional[datetime] = None,
+):
+    """
+    List all analyses with pagination
+    """
+    try:
+        analysis_service = get_analysis_service()
+
+        versions = await analysis_service.list_analyses(
+            limit=limit, skip=skip, before=before, projection=VERSION_PROJECTION
+        )
+        etag = _compute_etag(versions)
+        headers = {"ETag": etag, **POLL_CACHE_HEADERS}
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+
+        analyses = await analysis_service.list_analyses(
+            limit=limit, skip=skip, before=before
+        )
+        next_before = analyses[-1]["created_at"] if analyses else None
+        return ORJSONResponse({
+            "analyses": analyses,
+            "limit": limit,
+            "skip": skip,
+            "next_before": next_before,
+        }, headers=headers)
+    except Exception as e:
+        logger.error(f"Error listing analyses: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to list analyses: {str(e)}")
@@ -0,0 +1,209 @@
+"""
+Authentication endpoints - signup, login, profiles and saved analyses
+"""
+
+from typing import Optional
+
+import msgspec
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, ConfigDict
+
+from app.services.auth_service import get_auth_service
+from app.utils.http import decode_body, json_response
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+router = APIRouter()
+
+
+class SignupRequest(msgspec.Struct):
+    email: str
+    username: str
+    password: str
+    full_name: str
+    profession: str
+
+
+class LoginRequest(msgspec.Struct):
+    email: str
+    password: str
+
+
+class UpdateProfileRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    full_name: Optional[str] = None
+    profession: Optional[str] = None
+    email: Optional[str] = None
+    profile_photo: Optional[str] = None
+
+
+class SaveAnalysisRequest(msgspec.Struct):
+    user_id: str
+    analysis_id: str
+    model_url: str
+    report_url: str
+
+
+@router.post("/signup")
+async def signup(http_request: Request):
+    """
+    Register a new user
+    """
+    request = await decode_body(http_request, SignupRequest)
+    try:
+        auth_service = get_auth_service()
+        result = await auth_service.register_user(
+            email=request.email,
+            username=request.username,
+            password=request.password,
+            full_name=request.full_name,
+            profession=request.profession
+        )
+        
+        if result["success"]:
+            return json_response(
+                {"success": True, "message": "User registered successfully", "data": result}
+            )
+        else:
+            raise HTTPException(status_code=400, detail=result["error"])
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error during signup: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Signup failed: {str(e)}")
+
+
+@router.post("/login")
+async def login(http_request: Request):
+    """
+    Login user with email and password
+    """
+    request = await decode_body(http_request, LoginRequest)
+    try:
+        auth_service = get_auth_service()
+        result = await auth_service.login_user(
+            email=request.email,
+            password=request.password
+        )
+        
+        if result["success"]:
+            return json_response({"success": True, "message": "Login successful", "data": result})
+        else:
+            raise HTTPException(status_code=401, detail=result["error"])
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error during login: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Login failed: {str(e)}")
+
+
+@router.get("/user/{user_id}")
+async def get_user(user_id: str):
+    """
+    Get user profile information
+    """
+    try:
+        auth_service = get_auth_service()
+        user = await auth_service.get_user(user_id)
+        
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        
+        return {"success": True, "data": user}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching user {user_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch user: {str(e)}")
+
+
+@router.post("/update-profile")
+async def update_profile(user_id: str, request: UpdateProfileRequest):
+    """
+    Update user profile information
+    """
+    try:
+        auth_service = get_auth_service()
+        # Only the fields the client sent reach the $set
+        result = await auth_service.update_user_profile(
+            user_id=user_id, **request.model_dump(exclude_none=True)
+        )
+        
+        if result["success"]:
+            return {"success": True, "message": result["message"], "data": result["user"]}
+        else:
+            raise HTTPException(status_code=400, detail=result["error"])
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error updating profile: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to update profile: {str(e)}")
+
+
+@router.post("/save-analysis")
+async def save_analysis_to_user(http_request: Request):
+    """
+    Save analysis report URL to user's account
+    """
+    request = await decode_body(http_request, SaveAnalysisRequest)
+    try:
+        auth_service = get_auth_service()
+        success = await auth_service.save_analysis_to_user(
+            user_id=request.user_id,
+            analysis_id=request.analysis_id,
+            model_url=request.model_url,
+            report_url=request.report_url
+        )
+        
+        if success:
+            return {"success": True, "message": "Analysis saved to your account"}
+        else:
+            raise HTTPException(status_code=400, detail="Failed to save analysis")
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error saving analysis: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to save analysis: {str(e)}")
+
+
+@router.get("/user/{user_id}/analyses")
+async def get_user_analyses(user_id: str, limit: int = 50, skip: int = 0):
+    """
+    Get user's analysis history, most recently saved first
+    (skip=0 is the newest page)
+    """
+    try:
+        auth_service = get_auth_service()
+        analyses = await auth_service.get_user_analysis_history(
+            user_id, limit=limit, skip=skip
+        )
+        
+        return {"success": True, "analyses": analyses}
+        
+    except Exception as e:
+        logger.error(f"Error fetching user analyses: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch analyses: {str(e)}")
+
+
+
+@router.delete("/user/{user_id}/analysis/{analysis_id}")
+async def delete_user_analysis(user_id: str, analysis_id: str):
+    """
+    Delete a single analysis from user's history
+    """
+    try:
+        auth_service = get_auth_service()
+        success = await auth_service.delete_analysis_from_user(user_id, analysis_id)
+        if success:
+            return {"success": True, "message": "Analysis deleted from your history."}
+        else:
+            raise HTTPException(status_code=404, detail="Analysis not found or could not be deleted.")
+    except Exception as e:
+        logger.error(f"Error deleting analysis from user history: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to delete analysis: {str(e)}")
@@ -0,0 +1,63 @@
+"""
+Contact form endpoint
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+import msgspec
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+
+from app.database.mongodb import get_database
+from app.utils.http import decode_body, json_response
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+router = APIRouter()
+
+
+class ContactRequest(msgspec.Struct):
+    name: str
+    email: str
+    subject: str
+    message: str
+
+
+async def _store_contact_message(contact_doc: Dict[str, Any]) -> None:
+    """Save a contact form submission"""
+    try:
+        db = await get_database()
+        await db.contact_messages.insert_one(contact_doc)
+        logger.info(f"Contact message received from {contact_doc['email']}")
+    except Exception as e:
+        logger.error(f"Error saving contact message from {contact_doc['email']}: {str(e)}")
+
+
+@router.post("/contact")
+async def contact_us(http_request: Request, background_tasks: BackgroundTasks):
+    """
+    Handle contact form submissions
+    """
+    request = await decode_body(http_request, ContactRequest)
+    try:
+        contact_doc = {
+            "name": request.name,
+            "email": request.email,
+            "subject": request.subject,
+            "message": request.message,
+            "submitted_at": datetime.now(timezone.utc),
+            "status": "new"
+        }
+        
+        # The visitor only needs an acknowledgement, so the message is
+        # stored after the response has gone out
+        background_tasks.add_task(_store_contact_message, contact_doc)
+        
+        return json_response({
+            "success": True,
+            "message": "Thank you for contacting us. We will get back to you soon!"
+        })
+        
+    except Exception as e:
+        logger.error(f"Error processing contact form: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to submit contact form: {str(e)}")
@@ -2,18 +2,44 @@
 Analysis Service - Core logic for bias and fairness analysis
 """
 
-from typing import Optional, Dict, Any, List
-from datetime import datetime
-from app.database.mongodb import get_database
-from app.database.schemas import AnalysisDocument
+import asyncio
+import time
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timezone
+from app.config import settings
+from app.database.repositories import get_analysis_repo, PUSH_BATCH_SIZE
 from app.services.data_generator import DataGenerator
-from app.services.model_client import ModelClient
+from app.services.model_client import ModelClient, batch_url_for
 from app.services.bias_analyzer import BiasAnalyzer
 from app.services.report_generator import ReportGenerator
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Progress is only persisted when it moves by this many points or when this
+# many seconds have passed since the last write, so the UI stays live
+# without one MongoDB write per model request.
+PROGRESS_WRITE_STEP = 5
+PROGRESS_WRITE_INTERVAL = 1.0
+
+# Report generation only needs the stored results.
+REPORT_PROJECTION = {
+    "status": 1,
+    "results": 1,
+    "report_generated": 1,
+    "report_path": 1,
+}
+
+# Every write to an analysis stamps updated_at, so these two fields are
+# enough to tell a poller whether anything changed.
+VERSION_PROJECTION = {"_id": 0, "analysis_id": 1, "status": 1, "updated_at": 1}
+
+
+# Per-input outputs (None where a prediction failed) and the ones still to
+# be pushed to the analysis document
+PredictionResults = Tuple[List[Optional[Dict[str, Any]]], List[Dict[str, Any]]]
+
 
 class AnalysisService:
     """Service for managing bias analysis workflows"""
@@ -28,27 +54,30 @@ class AnalysisService:
         self, analysis_id: str, model_url: str
     ) -> None:
         """Create a new analysis record in the database"""
-        db = await get_database()
+        repo = await get_analysis_repo()
+        now = datetime.now(timezone.utc)
         analysis_doc = {
             "analysis_id": analysis_id,
             "model_url": model_url,
             "status": "started",
             "progress": 0.0,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
+            "created_at": now,
+            "updated_at": now,
             "synthetic_inputs": [],
             "model_outputs": [],
             "bias_scores": [],
             "report_generated": False,
         }
-        await db.analyses.insert_one(analysis_doc)
+        await repo.insert(analysis_doc)
         logger.info(f"Created analysis record: {analysis_id}")
 
-    async def get_analysis(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+    async def get_analysis(
+        self, analysis_id: str, projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """Get analysis by ID"""
-        db = await get_database()
-        analysis = await db.analyses.find_one({"analysis_id": analysis_id})
-        if analysis:
+        repo = await get_analysis_repo()
+        analysis = await repo.find(analysis_id, projection)
+        if analysis and "_id" in analysis:
             analysis["_id"] = str(analysis["_id"])
         return analysis
 
@@ -56,21 +85,37 @@ class AnalysisService:
         self, analysis_id: str, updates: Dict[str, Any]
     ) -> None:
         """Update analysis record"""
-        db = await get_database()
-        updates["updated_at"] = datetime.utcnow()
-        await db.analyses.update_one(
-            {"analysis_id": analysis_id}, {"$set": updates}
-        )
+        repo = await get_analysis_repo()
+        await repo.set_fields(analysis_id, updates)
+
+    async def push_to_analysis(
+        self,
+        analysis_id: str,
+        field: str,
+        items: List[Dict[str, Any]],
+        updates: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Append items to an array field, optionally setting other fields"""
+        repo = await get_analysis_repo()
+        await repo.push(analysis_id, field, items, updates)
 
     async def list_analyses(
-        self, limit: int = 10, skip: int = 0
+        self,
+        limit: int = 10,
+        skip: int = 0,
+        before: Optional[datetime] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        """List all analyses with pagination"""
-        db = await get_database()
-        cursor = db.analyses.find().sort("created_at", -1).skip(skip).limit(limit)
-        analyses = await cursor.to_list(length=limit)
+        """
+        List analyses newest first.
+        Pass the created_at of the last item seen as ``before`` to page
+        through the index instead of skipping over earlier pages.
+        """
+        repo = await get_analysis_repo()
+        analyses = await repo.list_recent(limit, skip, before, projection)
         for analysis in analyses:
-            analysis["_id"] = str(analysis["_id"])
+            if "_id" in analysis:
+                analysis["_id"] = str(analysis["_id"])
         return analyses
 
     async def run_analysis(self, analysis_id: str, model_url: str) -> None:
@@ -81,67 +126,49 @@ class AnalysisService:
             logger.info(f"Starting analysis workflow for {analysis_id}")
 
             # Step 1: Generate synthetic data (20% progress)
-            await self.update_analysis(analysis_id, {"status": "in_progress", "progress": 10})
             logger.info(f"[{analysis_id}] Generating synthetic data...")
             synthetic_data = await self.data_generator.generate_data()
-            await self.update_analysis(
+            generated_at = datetime.now(timezone.utc)
+            await self.push_to_analysis(
                 analysis_id,
-                {
-                    "synthetic_inputs": [
-                        {
-                            "input_id": f"input_{i}",
-                            "features": data,
-                            "timestamp": datetime.utcnow(),
-                        }
-                        for i, data in enumerate(synthetic_data)
-                    ],
-                    "progress": 20,
-                },
+                "synthetic_inputs",
+                [
+                    {
+                        "input_id": f"input_{i}",
+                        "features": data,
+                        "timestamp": generated_at,
+                    }
+                    for i, data in enumerate(synthetic_data)
+                ],
+                {"status": "in_progress", "progress": 20},
             )
 
             # Step 2: Send requests to model API (40% progress)
             logger.info(f"[{analysis_id}] Sending requests to model API...")
-            model_outputs = []
-            total_inputs = len(synthetic_data)
-            attempts = 0
-            failures = 0
-            for i, input_data in enumerate(synthetic_data):
-                attempts += 1
-                try:
-                    output = await self.model_client.predict(model_url, input_data)
-                    model_outputs.append(
-                        {
-                            "input_id": f"input_{i}",
-                            "output": output,
-                            "timestamp": datetime.utcnow(),
-                        }
-                    )
-                except Exception as e:
-                    failures += 1
-                    logger.warning(f"[{analysis_id}] Failed to get prediction for input {i}: {str(e)}")
-                finally:
-                    # Always advance progress based on attempts, not successes,
-                    # so users don't feel "stuck" when an endpoint rejects requests.
-                    progress = 20 + int((i + 1) / total_inputs * 40)
-                    await self.update_analysis(analysis_id, {"progress": progress})
+            predicted = await self._predict_batched(
+                analysis_id, model_url, synthetic_data
+            )
+            if predicted is None:
+                predicted = await self._predict_per_row(
+                    analysis_id, model_url, synthetic_data
+                )
+            outputs, pending_outputs = predicted
 
-                # Fail fast if the endpoint is clearly not a usable prediction API.
-                # Example: a website returning 403/HTML, auth wall, etc.
-                if attempts >= 10 and len(model_outputs) == 0 and failures == attempts:
-                    raise RuntimeError(
-                        "Model endpoint rejected all requests (0 successful predictions). "
-                        "Please provide a valid prediction API endpoint (POST JSON → JSON)."
-                    )
+            # Keep inputs and outputs aligned for the analyzer when some
+            # predictions failed.
+            analyzed_inputs = [
+                synthetic_data[i] for i, output in enumerate(outputs) if output is not None
+            ]
+            model_outputs = [output for output in outputs if output is not None]
 
-            await self.update_analysis(
-                analysis_id, {"model_outputs": model_outputs, "progress": 60}
+            await self.push_to_analysis(
+                analysis_id, "model_outputs", pending_outputs, {"progress": 60}
             )
 
             # Step 3: Run bias analysis (80% progress)
             logger.info(f"[{analysis_id}] Running bias analysis...")
-            await self.update_analysis(analysis_id, {"progress": 65})
             bias_results = await self.bias_analyzer.analyze(
-                synthetic_data, model_outputs
+                analyzed_inputs, model_outputs
             )
             await self.update_analysis(
                 analysis_id,
@@ -161,7 +188,6 @@ class AnalysisService:
 
             # Step 4: Generate report (100% progress)
             logger.info(f"[{analysis_id}] Generating report...")
-            await self.update_analysis(analysis_id, {"progress": 90})
             report_path = await self.report_generator.generate_report(
                 analysis_id, bias_results
             )
@@ -170,7 +196,7 @@ class AnalysisService:
                 {
                     "status": "completed",
                     "progress": 100,
-                    "completed_at": datetime.utcnow(),
+                    "completed_at": datetime.now(timezone.utc),
                     "report_generated": True,
                     "report_path": report_path,
                 },
@@ -188,10 +214,143 @@ class AnalysisService:
                 },
             )
 
+    async def _predict_batched(
+        self, analysis_id: str, model_url: str, synthetic_data: List[Dict[str, Any]]
+    ) -> Optional[PredictionResults]:
+        """
+        Send inputs in chunks to the model's batch endpoint, if it has one
+        Returns (outputs, outputs not yet pushed), or None when the caller
+        should fall back to one request per input
+        """
+        batch_size = settings.model_batch_size
+        batch_url = batch_url_for(model_url) if batch_size > 0 else None
+        if batch_url is None:
+            return None
+
+        total_inputs = len(synthetic_data)
+        outputs: List[Optional[Dict[str, Any]]] = [None] * total_inputs
+        pending_outputs: List[Dict[str, Any]] = []
+
+        for start in range(0, total_inputs, batch_size):
+            chunk = synthetic_data[start:start + batch_size]
+            try:
+                # The first chunk doubles as the probe for the endpoint; a
+                # model without one shouldn't cost a full retry backoff
+                chunk_outputs = await self.model_client.predict_many(
+                    batch_url, chunk, max_attempts=1 if start == 0 else None
+                )
+            except Exception as e:
+                if start == 0:
+                    logger.info(
+                        f"[{analysis_id}] No usable batch endpoint at {batch_url} "
+                        f"({str(e)}); sending one request per input"
+                    )
+                    return None
+                logger.warning(
+                    f"[{analysis_id}] Failed to get predictions for inputs "
+                    f"{start}-{start + len(chunk) - 1}: {str(e)}"
+                )
+                chunk_outputs = []
+
+            received_at = datetime.now(timezone.utc)
+            for i, output in enumerate(chunk_outputs, start):
+                outputs[i] = {
+                    "input_id": f"input_{i}",
+                    "output": output,
+                    "timestamp": received_at,
+                }
+                pending_outputs.append(outputs[i])
+
+            # The caller pushes the last chunk along with the final progress
+            done = start + len(chunk)
+            if done < total_inputs:
+                await self.push_to_analysis(
+                    analysis_id,
+                    "model_outputs",
+                    pending_outputs,
+                    {"progress": 20 + int(done / total_inputs * 40)},
+                )
+                pending_outputs = []
+
+        return outputs, pending_outputs
+
+    async def _predict_per_row(
+        self, analysis_id: str, model_url: str, synthetic_data: List[Dict[str, Any]]
+    ) -> PredictionResults:
+        """
+        Send one request per input, a bounded number at a time
+        Returns (outputs, outputs not yet pushed)
+        """
+        total_inputs = len(synthetic_data)
+        outputs: List[Optional[Dict[str, Any]]] = [None] * total_inputs
+        pending_outputs: List[Dict[str, Any]] = []
+        attempts = 0
+        failures = 0
+        last_written_progress = 20
+        last_written_time = time.monotonic()
+
+        semaphore = asyncio.Semaphore(settings.model_max_concurrency)
+
+        async def predict_one(i: int, input_data: Dict[str, Any]):
+            async with semaphore:
+                try:
+                    output = await self.model_client.predict(model_url, input_data)
+                    return i, output, None
+                except Exception as e:
+                    return i, None, e
+
+        tasks = [
+            asyncio.create_task(predict_one(i, input_data))
+            for i, input_data in enumerate(synthetic_data)
+        ]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                i, output, error = await next_result
+                attempts += 1
+                if error is None:
+                    outputs[i] = {
+                        "input_id": f"input_{i}",
+                        "output": output,
+                        "timestamp": datetime.now(timezone.utc),
+                    }
+                    pending_outputs.append(outputs[i])
+                    if len(pending_outputs) >= PUSH_BATCH_SIZE:
+                        await self.push_to_analysis(
+                            analysis_id, "model_outputs", pending_outputs
+                        )
+                        pending_outputs = []
+                else:
+                    failures += 1
+                    logger.warning(f"[{analysis_id}] Failed to get prediction for input {i}: {str(error)}")
+
+                # Always advance progress based on attempts, not successes,
+                # so users don't feel "stuck" when an endpoint rejects requests.
+                progress = 20 + int(attempts / total_inputs * 40)
+                if (
+                    progress - last_written_progress >= PROGRESS_WRITE_STEP
+                    or time.monotonic() - last_written_time > PROGRESS_WRITE_INTERVAL
+                ):
+                    await self.update_analysis(analysis_id, {"progress": progress})
+                    last_written_progress = progress
+                    last_written_time = time.monotonic()
+
+                # Fail fast if the endpoint is clearly not a usable prediction API.
+                # Example: a website returning 403/HTML, auth wall, etc.
+                if attempts >= 10 and failures == attempts:
+                    raise RuntimeError(
+                        "Model endpoint rejected all requests (0 successful predictions). "
+                        "Please provide a valid prediction API endpoint (POST JSON → JSON)."
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return outputs, pending_outputs
+
     async def generate_report(self, analysis_id: str) -> Optional[str]:
         """Generate and return report path"""
         try:
-            analysis = await self.get_analysis(analysis_id)
+            analysis = await self.get_analysis(analysis_id, REPORT_PROJECTION)
             if not analysis:
                 logger.warning(f"Analysis not found: {analysis_id}")
                 return None
@@ -228,3 +387,9 @@ class AnalysisService:
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
             raise
+
+
+@lru_cache(maxsize=1)
+def get_analysis_service() -> AnalysisService:
+    """Return the process-wide analysis service"""
+    return AnalysisService()
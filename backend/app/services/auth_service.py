@@ -2,17 +2,33 @@
 Authentication Service - Handle user registration, login, and authentication
 """
 
+import asyncio
 import hashlib
+import hmac
 import secrets
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
-import uuid
-from app.database.mongodb import get_database
+from datetime import datetime, timezone
+from cachetools import TTLCache
+from pymongo.errors import DuplicateKeyError
+from app.config import settings
+from app.database.repositories import get_user_repo, ANALYSIS_HISTORY_LIMIT
+from app.utils.ids import new_uuid
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Stored hashes look like "pbkdf2_sha256$<iterations>$<salt>$<hash>". Hashes
+# written before the prefix was introduced are "<salt>$<hash>" and still
+# verify with the legacy iteration count.
+PASSWORD_HASH_ALGORITHM = "pbkdf2_sha256"
+PASSWORD_HASH_ITERATIONS = 100000
 
+# Short-lived per-process cache for get_user. Writes through this service
+# evict the entry; other workers see changes once the TTL expires.
+_user_cache: TTLCache = TTLCache(
+    maxsize=settings.user_cache_max_size, ttl=settings.user_cache_ttl_seconds
+)
 
 class AuthService:
     """Service for user authentication and management"""
@@ -20,12 +36,10 @@ class AuthService:
     async def delete_analysis_from_user(self, user_id: str, analysis_id: str) -> bool:
         """Delete a single analysis from user's analysis history"""
         try:
-            db = await get_database()
-            result = await db.users.update_one(
-                {"user_id": user_id},
-                {"$pull": {"analysis_history": {"analysis_id": analysis_id}}, "$set": {"updated_at": datetime.utcnow()}}
-            )
-            if result.modified_count > 0:
+            repo = await get_user_repo()
+            removed = await repo.pull_history(user_id, analysis_id)
+            _user_cache.pop(user_id, None)
+            if removed:
                 logger.info(f"Deleted analysis {analysis_id} from user {user_id}")
                 return True
             return False
@@ -44,22 +58,31 @@ class AuthService:
             'sha256',
             password.encode('utf-8'),
             salt.encode('utf-8'),
-            100000
+            PASSWORD_HASH_ITERATIONS
         )
-        return f"{salt}${password_hash.hex()}"
+        return f"{PASSWORD_HASH_ALGORITHM}${PASSWORD_HASH_ITERATIONS}${salt}${password_hash.hex()}"
 
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
         """Verify password against hash"""
         try:
-            salt, hash_hex = password_hash.split('$')
+            parts = password_hash.split('$')
+            if len(parts) == 2:
+                salt, hash_hex = parts
+                iterations = PASSWORD_HASH_ITERATIONS
+            else:
+                algorithm, iterations, salt, hash_hex = parts
+                if algorithm != PASSWORD_HASH_ALGORITHM:
+                    logger.error(f"Unsupported password hash algorithm: {algorithm}")
+                    return False
+                iterations = int(iterations)
             password_check = hashlib.pbkdf2_hmac(
                 'sha256',
                 password.encode('utf-8'),
                 salt.encode('utf-8'),
-                100000
+                iterations
             )
-            return password_check.hex() == hash_hex
+            return hmac.compare_digest(password_check, bytes.fromhex(hash_hex))
         except Exception as e:
             logger.error(f"Error verifying password: {str(e)}")
             return False
@@ -77,40 +100,37 @@ class AuthService:
         Returns user data if successful
         """
         try:
-            db = await get_database()
-            
-            # Check if user already exists
-            existing_user = await db.users.find_one({
-                "$or": [
-                    {"email": email.lower()},
-                    {"username": username.lower()}
-                ]
-            })
-            
-            if existing_user:
-                return {
-                    "success": False,
-                    "error": "Email or username already exists"
-                }
+            repo = await get_user_repo()
             
             # Create new user
-            user_id = str(uuid.uuid4())
-            password_hash = self.hash_password(password)
+            user_id = new_uuid()
+            # PBKDF2 is CPU-bound; hash on a worker thread so the event loop
+            # keeps serving other requests meanwhile.
+            password_hash = await asyncio.to_thread(self.hash_password, password)
             
+            now = datetime.now(timezone.utc)
             user_doc = {
                 "user_id": user_id,
-                "email": email.lower(),
-                "username": username.lower(),
+                "email": email,
+                "username": username,
                 "password_hash": password_hash,
                 "full_name": full_name,
                 "profession": profession,
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
+                "created_at": now,
+                "updated_at": now,
                 "analysis_history": [],
                 "is_active": True
             }
             
-            await db.users.insert_one(user_doc)
+            # The unique email/username indexes reject duplicates atomically,
+            # so there is no separate existence check before the insert.
+            try:
+                await repo.insert(user_doc)
+            except DuplicateKeyError:
+                return {
+                    "success": False,
+                    "error": "Email or username already exists"
+                }
             
             logger.info(f"User registered: {email}")
             return {
@@ -139,12 +159,10 @@ class AuthService:
         Returns user data if successful
         """
         try:
-            db = await get_database()
+            repo = await get_user_repo()
             
             # Find user by email
-            user = await db.users.find_one({
-                "email": email.lower()
-            })
+            user = await repo.find_for_login(email)
             
             if not user:
                 return {
@@ -153,7 +171,9 @@ class AuthService:
                 }
             
             # Verify password
-            if not self.verify_password(password, user["password_hash"]):
+            if not await asyncio.to_thread(
+                self.verify_password, password, user["password_hash"]
+            ):
                 return {
                     "success": False,
                     "error": "Invalid email or password"
@@ -185,13 +205,17 @@ class AuthService:
 
     async def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user by ID"""
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            return cached
+
         try:
-            db = await get_database()
-            user = await db.users.find_one({"user_id": user_id})
+            repo = await get_user_repo()
+            user = await repo.find(user_id)
             
             if user:
                 # Return user data without password hash
-                return {
+                user_data = {
                     "user_id": user["user_id"],
                     "email": user["email"],
                     "username": user["username"],
@@ -201,6 +225,8 @@ class AuthService:
                     "analysis_history": user.get("analysis_history", []),
                     "created_at": user["created_at"]
                 }
+                _user_cache[user_id] = user_data
+                return user_data
             return None
             
         except Exception as e:
@@ -216,24 +242,19 @@ class AuthService:
     ) -> bool:
         """Save analysis URL to user's analysis history"""
         try:
-            db = await get_database()
+            repo = await get_user_repo()
             
             analysis_record = {
                 "analysis_id": analysis_id,
                 "model_url": model_url,
                 "report_url": report_url,
-                "saved_at": datetime.utcnow()
+                "saved_at": datetime.now(timezone.utc)
             }
             
-            result = await db.users.update_one(
-                {"user_id": user_id},
-                {
-                    "$push": {"analysis_history": analysis_record},
-                    "$set": {"updated_at": datetime.utcnow()}
-                }
-            )
+            saved = await repo.push_history(user_id, analysis_record)
+            _user_cache.pop(user_id, None)
             
-            if result.modified_count > 0:
+            if saved:
                 logger.info(f"Saved analysis {analysis_id} for user {user_id}")
                 return True
             return False
@@ -242,15 +263,13 @@ class AuthService:
             logger.error(f"Error saving analysis to user: {str(e)}")
             return False
 
-    async def get_user_analysis_history(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get user's analysis history"""
+    async def get_user_analysis_history(
+        self, user_id: str, limit: int = ANALYSIS_HISTORY_LIMIT, skip: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Get a page of the user's analysis history, newest first"""
         try:
-            db = await get_database()
-            user = await db.users.find_one({"user_id": user_id})
-            
-            if user:
-                return user.get("analysis_history", [])
-            return []
+            repo = await get_user_repo()
+            return await repo.history_page(user_id, limit, skip)
             
         except Exception as e:
             logger.error(f"Error getting user analysis history: {str(e)}")
@@ -266,40 +285,39 @@ class AuthService:
     ) -> Dict[str, Any]:
         """Update user profile information"""
         try:
-            db = await get_database()
+            repo = await get_user_repo()
             
             # Build update data
-            update_data = {"updated_at": datetime.utcnow()}
+            update_data = {}
             
             if full_name:
                 update_data["full_name"] = full_name
             if profession:
                 update_data["profession"] = profession
             if email:
-                # Check if new email is already used
-                existing = await db.users.find_one({
-                    "email": email.lower(),
-                    "user_id": {"$ne": user_id}
-                })
-                if existing:
+                update_data["email"] = email
+            if profile_photo:
+                update_data["profile_photo"] = profile_photo
+            
+            if not update_data:
+                # Nothing to change; skip the write and return the profile as is
+                user = await repo.find(user_id)
+            else:
+                # An email already used by another account is rejected by the
+                # unique index, so no separate lookup is needed.
+                try:
+                    user = await repo.update_profile(user_id, update_data)
+                    _user_cache.pop(user_id, None)
+                except DuplicateKeyError:
                     return {
                         "success": False,
                         "error": "Email already in use"
                     }
-                update_data["email"] = email.lower()
-            if profile_photo:
-                update_data["profile_photo"] = profile_photo
-            
-            result = await db.users.update_one(
-                {"user_id": user_id},
-                {"$set": update_data}
-            )
             
-            if result.modified_count > 0:
+            if user:
                 logger.info(f"Updated profile for user {user_id}")
                 
                 # Return updated user data
-                user = await db.users.find_one({"user_id": user_id})
                 return {
                     "success": True,
                     "message": "Profile updated successfully",
@@ -324,3 +342,9 @@ class AuthService:
                 "success": False,
                 "error": f"Update failed: {str(e)}"
             }
+
+
+@lru_cache(maxsize=1)
+def get_auth_service() -> AuthService:
+    """Return the process-wide auth service"""
+    return AuthService()
@@ -2,13 +2,55 @@
 Bias Analyzer Service - Core bias and fairness analysis using Fairlearn, AIF360, SHAP, LIME
 """
 
+import asyncio
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from app.services.bias_kernels import group_moments
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+
+def _extract_prediction(output: Any) -> Any:
+    """Pull the prediction value out of a single model response"""
+    if isinstance(output, dict):
+        # Try common prediction keys
+        return (
+            output.get("prediction")
+            or output.get("result")
+            or output.get("output")
+            or output.get("score", 0)
+        )
+    if isinstance(output, (int, float)):
+        return output
+    return 0
+
+
+PROTECTED_ATTRIBUTES = ("gender", "race")
+INFLUENCE_FEATURES = ("age", "income", "experience_years", "credit_score")
+
+
+def _group_mean_std(
+    values: np.ndarray, preds: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Per-group label, mean, sample std and count of preds, grouped by values"""
+    codes, labels = pd.factorize(values, sort=True)
+    present = codes >= 0
+    moments = group_moments(codes[present], preds[present], len(labels))
+    sums, sumsq, counts = moments[:, 0], moments[:, 1], moments[:, 2]
+    means = sums / counts
+    # Sample std to match pandas; undefined (NaN) for single-row groups
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variances = np.maximum(sumsq - sums * means, 0.0) / (counts - 1)
+    return {
+        "labels": labels,
+        "mean": means,
+        "std": np.sqrt(variances),
+        "count": counts.astype(np.int64),
+    }
+
+
 # Note: Fairlearn and AIF360 require specific data formats
 # This is a simplified implementation that demonstrates the structure
 
@@ -29,60 +71,17 @@ class BiasAnalyzer:
         Returns analysis results including bias scores, fairness metrics, etc.
         """
         try:
-            # Convert to DataFrame for analysis
-            df_inputs = pd.DataFrame(synthetic_inputs)
-            df_outputs = pd.DataFrame(model_outputs)
-
-            # Extract predictions (assuming output has 'prediction' or similar)
-            predictions = []
-            for output in model_outputs:
-                pred = output.get("output", {})
-                if isinstance(pred, dict):
-                    # Try common prediction keys
-                    predictions.append(
-                        pred.get("prediction")
-                        or pred.get("result")
-                        or pred.get("output")
-                        or pred.get("score", 0)
-                    )
-                elif isinstance(pred, (int, float)):
-                    predictions.append(pred)
-                else:
-                    predictions.append(0)
-
-            df_inputs["prediction"] = predictions
-
-            # Calculate overall bias score
-            overall_bias_score = self._calculate_overall_bias_score(
-                df_inputs, predictions
-            )
-
-            # Calculate fairness metrics
-            fairness_metrics = self._calculate_fairness_metrics(df_inputs, predictions)
-
-            # Calculate feature influence
-            feature_influence = self._calculate_feature_influence(
-                df_inputs, predictions
-            )
-
-            # Calculate demographic parity
-            demographic_parity = self._calculate_demographic_parity(
-                df_inputs, predictions
+            # The pandas/numpy work (and the first-call numba compile) runs
+            # in a thread so it never stalls the event loop.
+            results, df_inputs, predictions = await asyncio.to_thread(
+                self._compute_metrics, synthetic_inputs, model_outputs
             )
 
             # Generate explainability insights (simplified)
-            explainability_insights = await self._generate_explainability_insights(
+            results["explainability_insights"] = await self._generate_explainability_insights(
                 df_inputs, predictions
             )
 
-            results = {
-                "overall_bias_score": overall_bias_score,
-                "fairness_metrics": fairness_metrics,
-                "feature_influence": feature_influence,
-                "demographic_parity": demographic_parity,
-                "explainability_insights": explainability_insights,
-            }
-
             logger.info("Bias analysis completed successfully")
             return results
 
@@ -90,20 +89,75 @@ class BiasAnalyzer:
             logger.error(f"Error in bias analysis: {str(e)}")
             raise
 
+    def _compute_metrics(
+        self,
+        synthetic_inputs: List[Dict[str, Any]],
+        model_outputs: List[Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], pd.DataFrame, np.ndarray]:
+        """Compute the numeric results, returning them with the inputs frame and predictions"""
+        # Convert to DataFrame for analysis
+        df_inputs = pd.DataFrame(synthetic_inputs)
+        outputs = pd.Series(
+            [output.get("output", {}) for output in model_outputs], dtype=object
+        )
+
+        # Extract predictions (assuming output has 'prediction' or similar)
+        predictions = (
+            pd.to_numeric(outputs.map(_extract_prediction), errors="coerce")
+            .fillna(0)
+            .to_numpy(dtype=np.float64)
+        )
+
+        # One grouped pass per protected attribute; every metric below
+        # is derived from these tables.
+        present = [col for col in PROTECTED_ATTRIBUTES if col in df_inputs.columns]
+        stats = {
+            col: _group_mean_std(df_inputs[col].to_numpy(), predictions)
+            for col in present
+        }
+
+        if stats:
+            # Calculate overall bias score
+            overall_bias_score = self._calculate_overall_bias_score(stats)
+
+            # Calculate fairness metrics
+            fairness_metrics = self._calculate_fairness_metrics(stats)
+
+            # Calculate demographic parity
+            demographic_parity = self._calculate_demographic_parity(stats)
+        else:
+            # No protected attributes to compare groups on
+            overall_bias_score = 0.0
+            fairness_metrics = []
+            demographic_parity = []
+
+        # Calculate feature influence
+        feature_influence = self._calculate_feature_influence(
+            df_inputs, predictions
+        )
+
+        results = {
+            "overall_bias_score": overall_bias_score,
+            "fairness_metrics": fairness_metrics,
+            "feature_influence": feature_influence,
+            "demographic_parity": demographic_parity,
+        }
+        return results, df_inputs, predictions
+
     def _calculate_overall_bias_score(
-        self, df: pd.DataFrame, predictions: List[float]
+        self, stats: Dict[str, Dict[str, np.ndarray]]
     ) -> float:
         """Calculate overall bias score (0-1, lower is better)"""
         # Simplified bias score calculation
         # In production, this would use Fairlearn or AIF360 metrics
 
-        if "gender" in df.columns:
-            gender_bias = self._calculate_group_bias(df, predictions, "gender")
+        if "gender" in stats:
+            gender_bias = self._calculate_group_bias(stats["gender"])
         else:
             gender_bias = 0.0
 
-        if "race" in df.columns:
-            race_bias = self._calculate_group_bias(df, predictions, "race")
+        if "race" in stats:
+            race_bias = self._calculate_group_bias(stats["race"])
         else:
             race_bias = 0.0
 
@@ -111,19 +165,16 @@ class BiasAnalyzer:
         overall_bias = (gender_bias + race_bias) / 2.0
         return min(1.0, max(0.0, overall_bias))
 
-    def _calculate_group_bias(
-        self, df: pd.DataFrame, predictions: List[float], group_column: str
-    ) -> float:
+    def _calculate_group_bias(self, group_stats: Dict[str, np.ndarray]) -> float:
         """Calculate bias for a specific protected attribute"""
-        df["prediction"] = predictions
-        group_means = df.groupby(group_column)["prediction"].mean()
+        group_means = group_stats["mean"]
 
         if len(group_means) < 2:
             return 0.0
 
         # Calculate coefficient of variation across groups
         mean_of_means = group_means.mean()
-        std_of_means = group_means.std()
+        std_of_means = group_means.std(ddof=1)
 
         if mean_of_means == 0:
             return 0.0
@@ -132,90 +183,98 @@ class BiasAnalyzer:
         return min(1.0, bias_score)
 
     def _calculate_fairness_metrics(
-        self, df: pd.DataFrame, predictions: List[float]
+        self, stats: Dict[str, Dict[str, np.ndarray]]
     ) -> List[Dict[str, Any]]:
         """Calculate various fairness metrics"""
-        df["prediction"] = predictions
         metrics = []
 
         # Demographic Parity
-        if "gender" in df.columns:
-            gender_parity = self._demographic_parity(df, "gender")
+        if "gender" in stats:
+            gender_parity = self._demographic_parity(stats["gender"])
             metrics.append({"metric": "demographic_parity_gender", "value": gender_parity})
 
-        if "race" in df.columns:
-            race_parity = self._demographic_parity(df, "race")
+        if "race" in stats:
+            race_parity = self._demographic_parity(stats["race"])
             metrics.append({"metric": "demographic_parity_race", "value": race_parity})
 
         # Equalized Odds (simplified)
-        if "gender" in df.columns:
-            equalized_odds = self._equalized_odds(df, "gender")
+        if "gender" in stats:
+            equalized_odds = self._equalized_odds(stats["gender"])
             metrics.append({"metric": "equalized_odds_gender", "value": equalized_odds})
 
         return metrics
 
-    def _demographic_parity(self, df: pd.DataFrame, group_column: str) -> float:
+    def _demographic_parity(self, group_stats: Dict[str, np.ndarray]) -> float:
         """Calculate demographic parity metric"""
-        group_means = df.groupby(group_column)["prediction"].mean()
+        group_means = group_stats["mean"]
         if len(group_means) < 2:
             return 0.0
-        return group_means.std() / (group_means.mean() + 1e-6)
+        return group_means.std(ddof=1) / (group_means.mean() + 1e-6)
 
-    def _equalized_odds(self, df: pd.DataFrame, group_column: str) -> float:
+    def _equalized_odds(self, group_stats: Dict[str, np.ndarray]) -> float:
         """Calculate equalized odds metric (simplified)"""
         # This is a simplified version
         # Full implementation would require true labels
-        return self._demographic_parity(df, group_column)
+        return self._demographic_parity(group_stats)
 
     def _calculate_feature_influence(
-        self, df: pd.DataFrame, predictions: List[float]
+        self, df: pd.DataFrame, predictions: np.ndarray
     ) -> List[Dict[str, Any]]:
         """Calculate feature influence on bias"""
-        df["prediction"] = predictions
-
-        # Simple correlation-based feature importance
-        feature_influence = []
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        numeric_cols = [col for col in numeric_cols if col != "prediction"]
-
-        for col in numeric_cols:
-            if col in ["age", "income", "experience_years", "credit_score"]:
-                correlation = abs(df[col].corr(df["prediction"]))
-                feature_influence.append(
-                    {
-                        "feature": col,
-                        "influence": correlation,
-                        "importance": correlation,
-                    }
-                )
+        # Simple correlation-based feature importance, computed for all
+        # numeric features against the predictions in one matrix product
+        numeric_cols = [
+            col
+            for col in df.select_dtypes(include=[np.number]).columns
+            if col in INFLUENCE_FEATURES
+        ]
+        if not numeric_cols:
+            return []
+
+        # float32 halves the memory traffic; a correlation shown to three
+        # or four decimals does not need double precision
+        features = np.ascontiguousarray(df[numeric_cols].to_numpy(dtype=np.float32))
+        preds = predictions.astype(np.float32)
+        centered = features - features.mean(axis=0)
+        centered_preds = preds - preds.mean()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlations = (centered.T @ centered_preds) / (
+                features.std(axis=0) * preds.std() * len(preds)
+            )
+        # Constant columns have no defined correlation; report no influence.
+        # tolist() converts back to Python floats, which BSON can encode.
+        influences = np.abs(np.nan_to_num(correlations)).tolist()
+
+        feature_influence = [
+            {"feature": col, "influence": influence, "importance": influence}
+            for col, influence in zip(numeric_cols, influences)
+        ]
 
         # Sort by influence
         feature_influence.sort(key=lambda x: x["influence"], reverse=True)
         return feature_influence
 
     def _calculate_demographic_parity(
-        self, df: pd.DataFrame, predictions: List[float]
+        self, stats: Dict[str, Dict[str, np.ndarray]]
     ) -> List[Dict[str, Any]]:
         """Calculate demographic parity breakdown"""
-        df["prediction"] = predictions
-        parity_data = []
+        names: List[str] = []
+        means: List[np.ndarray] = []
 
-        if "gender" in df.columns:
-            gender_stats = df.groupby("gender")["prediction"].agg(["mean", "count"])
-            for gender, row in gender_stats.iterrows():
-                parity_data.append(
-                    {"name": f"Gender: {gender}", "value": row["mean"]}
-                )
+        for col, prefix in (("gender", "Gender"), ("race", "Race")):
+            if col in stats:
+                names.extend(f"{prefix}: {label}" for label in stats[col]["labels"])
+                means.append(stats[col]["mean"])
 
-        if "race" in df.columns:
-            race_stats = df.groupby("race")["prediction"].agg(["mean", "count"])
-            for race, row in race_stats.iterrows():
-                parity_data.append({"name": f"Race: {race}", "value": row["mean"]})
+        if not names:
+            return []
 
-        return parity_data
+        # Unbox all group means to Python floats in one call
+        values = np.concatenate(means).tolist()
+        return [{"name": name, "value": value} for name, value in zip(names, values)]
 
     async def _generate_explainability_insights(
-        self, df: pd.DataFrame, predictions: List[float]
+        self, df: pd.DataFrame, predictions: np.ndarray
     ) -> Dict[str, Any]:
         """
         Generate explainability insights using SHAP or LIME
@@ -0,0 +1,59 @@
+"""
+Numeric kernels for the bias analyzer
+"""
+
+from typing import Callable, Optional
+import numpy as np
+
+# numba is optional and slow to import, so it is loaded on the first
+# analysis rather than at API startup; without it we fall back to numpy.
+_group_moments_impl: Optional[Callable[[np.ndarray, np.ndarray, int], np.ndarray]] = None
+
+
+def _group_moments_numpy(codes: np.ndarray, preds: np.ndarray, k: int) -> np.ndarray:
+    """Per-group (sum, sum of squares, count) using bincount"""
+    out = np.empty((k, 3))
+    out[:, 0] = np.bincount(codes, weights=preds, minlength=k)
+    out[:, 1] = np.bincount(codes, weights=preds * preds, minlength=k)
+    out[:, 2] = np.bincount(codes, minlength=k)
+    return out
+
+
+# Serial on purpose: every row scatters into one of a handful of groups,
+# so a prange loop would race on the same output rows.
+def _group_moments_loop(codes, preds, k):
+    out = np.zeros((k, 3))
+    for i in range(codes.shape[0]):
+        c = codes[i]
+        p = preds[i]
+        out[c, 0] += p
+        out[c, 1] += p * p
+        out[c, 2] += 1.0
+    return out
+
+
+def _load_group_moments() -> Callable[[np.ndarray, np.ndarray, int], np.ndarray]:
+    """Pick the numba kernel if numba is installed, else the numpy one"""
+    try:
+        from numba import njit
+    except ImportError:
+        return _group_moments_numpy
+
+    jitted = njit(cache=True)(_group_moments_loop)
+
+    def _group_moments_jit(codes: np.ndarray, preds: np.ndarray, k: int) -> np.ndarray:
+        return jitted(
+            codes.astype(np.int64, copy=False),
+            preds.astype(np.float64, copy=False),
+            k,
+        )
+
+    return _group_moments_jit
+
+
+def group_moments(codes: np.ndarray, preds: np.ndarray, k: int) -> np.ndarray:
+    """Per-group (sum, sum of squares, count) in a single pass"""
+    global _group_moments_impl
+    if _group_moments_impl is None:
+        _group_moments_impl = _load_group_moments()
+    return _group_moments_impl(codes, preds, k)
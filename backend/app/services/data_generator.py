@@ -2,62 +2,95 @@
 Data Generator Service - Generate synthetic test data using Faker or CTGAN
 """
 
+import asyncio
 import pandas as pd
 import numpy as np
 from faker import Faker
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from app.config import settings
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Number of distinct city names sampled from Faker for the location column.
+# The pool is built on first use and then only read. Two analyses starting
+# together may both build it; the last one wins, which is harmless.
+CITY_POOL_SIZE = 2048
+_CITY_POOL: Optional[np.ndarray] = None
+
+
+def _get_city_pool(faker: Faker) -> np.ndarray:
+    """Return the shared pool of city names, building it on first use"""
+    global _CITY_POOL
+    if _CITY_POOL is None:
+        _CITY_POOL = np.array([faker.city() for _ in range(CITY_POOL_SIZE)])
+    return _CITY_POOL
+
 
 class DataGenerator:
     """Service for generating synthetic test data"""
 
+    # One instance is shared by every analysis in the process (through
+    # get_analysis_service), and _generate_with_faker runs on worker threads,
+    # so concurrent analyses share self.rng and self.faker. numpy's Generator
+    # serializes draws through its bit generator's lock, and Faker is only
+    # used to build the city pool, so no per-call state lives on the instance.
+
     def __init__(self):
         self.faker = Faker()
         self.generator_type = settings.synthetic_data_generator
+        self.rng = np.random.default_rng()
 
     async def generate_data(self) -> List[Dict[str, Any]]:
         """
         Generate synthetic data for bias testing
         Returns a list of dictionaries with features
         """
+        # Sampling (and building the city pool on first use) is CPU work,
+        # so it runs in a thread rather than on the event loop
         if self.generator_type == "faker":
-            return self._generate_with_faker()
+            return await asyncio.to_thread(self._generate_with_faker)
         elif self.generator_type == "ctgan":
             return await self._generate_with_ctgan()
         else:
             logger.warning(f"Unknown generator type: {self.generator_type}, using Faker")
-            return self._generate_with_faker()
+            return await asyncio.to_thread(self._generate_with_faker)
 
     def _generate_with_faker(self) -> List[Dict[str, Any]]:
         """Generate synthetic data using Faker library"""
-        data = []
         size = settings.synthetic_data_size
+        rng = self.rng
+
+        # Draw each column in one vectorized call, then zip into records.
+        # Faker is only used to build the pool of city names.
+        city_pool = _get_city_pool(self.faker)
 
-        for _ in range(size):
-            # Generate diverse demographic and feature data
-            record = {
-                "age": np.random.randint(18, 80),
-                "gender": np.random.choice(["male", "female", "other"], p=[0.48, 0.48, 0.04]),
-                "race": np.random.choice(
-                    ["white", "black", "asian", "hispanic", "other"],
-                    p=[0.6, 0.13, 0.06, 0.18, 0.03],
-                ),
-                "education": np.random.choice(
-                    ["high_school", "bachelor", "master", "phd"],
-                    p=[0.3, 0.4, 0.25, 0.05],
-                ),
-                "income": np.random.normal(50000, 20000),
-                "experience_years": np.random.randint(0, 40),
-                "location": self.faker.city(),
-                "credit_score": np.random.randint(300, 850),
-            }
+        columns = {
+            "age": rng.integers(18, 80, size),
+            "gender": rng.choice(["male", "female", "other"], size=size, p=[0.48, 0.48, 0.04]),
+            "race": rng.choice(
+                ["white", "black", "asian", "hispanic", "other"],
+                size=size,
+                p=[0.6, 0.13, 0.06, 0.18, 0.03],
+            ),
+            "education": rng.choice(
+                ["high_school", "bachelor", "master", "phd"],
+                size=size,
+                p=[0.3, 0.4, 0.25, 0.05],
+            ),
             # Ensure income is positive
-            record["income"] = max(0, record["income"])
-            data.append(record)
+            "income": np.maximum(rng.normal(50000, 20000, size), 0.0),
+            "experience_years": rng.integers(0, 40, size),
+            "location": city_pool[rng.integers(0, len(city_pool), size)],
+            "credit_score": rng.integers(300, 850, size),
+        }
+
+        # tolist() hands back native Python values, which BSON can encode
+        names = list(columns)
+        data = [
+            dict(zip(names, values))
+            for values in zip(*(column.tolist() for column in columns.values()))
+        ]
 
         logger.info(f"Generated {len(data)} synthetic records using Faker")
         return data
@@ -70,4 +103,4 @@ class DataGenerator:
         """
         # TODO: Implement CTGAN integration when training data is available
         logger.info("CTGAN not yet implemented, using Faker")
-        return self._generate_with_faker()
+        return await asyncio.to_thread(self._generate_with_faker)
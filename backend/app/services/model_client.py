@@ -2,13 +2,69 @@
 Model Client Service - Handle communication with user's AI model API
 """
 
+import asyncio
+import random
 import httpx
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit, urlunsplit
 from app.config import settings
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Retries back off exponentially from RETRY_BASE_DELAY seconds with random
+# jitter, never waiting longer than RETRY_MAX_DELAY between attempts. A
+# server-supplied Retry-After is honoured up to RETRY_AFTER_MAX seconds.
+RETRY_BASE_DELAY = 0.2
+RETRY_MAX_DELAY = 5.0
+RETRY_AFTER_MAX = 30.0
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+# Like the database handles, HTTP clients are bound to the event loop that
+# created them, so keep one per loop and reuse its connection pool.
+_http_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        # follow_redirects=True lets http -> https (301/302) work seamlessly
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                settings.model_request_timeout,
+                connect=settings.model_connect_timeout,
+            ),
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=settings.model_max_connections,
+                max_keepalive_connections=settings.model_max_connections,
+            ),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+def batch_url_for(model_url: str) -> Optional[str]:
+    """
+    URL of the model's batch endpoint, by convention the prediction path
+    with a "_batch" suffix (/predict -> /predict_batch)
+    """
+    parts = urlsplit(model_url)
+    path = parts.path.rstrip("/")
+    if not path:
+        return None
+    return urlunsplit(parts._replace(path=f"{path}_batch"))
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client for the running event loop"""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class ModelClient:
     """Service for interacting with external AI model APIs"""
@@ -22,31 +78,81 @@ class ModelClient:
         Send prediction request to the model API
         Returns the model's prediction/output
         """
-        # follow_redirects=True lets http -> https (301/302) work seamlessly
-        async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-            for attempt in range(self.max_retries):
-                try:
-                    response = await client.post(
-                        model_url,
-                        json=input_data,
-                        headers={"Content-Type": "application/json"},
-                    )
-                    response.raise_for_status()
-                    result = response.json()
-                    return result
-                except httpx.TimeoutException:
-                    logger.warning(
-                        f"Timeout on attempt {attempt + 1}/{self.max_retries} for {model_url}"
-                    )
-                    if attempt == self.max_retries - 1:
-                        raise
-                except httpx.HTTPStatusError as e:
-                    logger.error(f"HTTP error {e.response.status_code} for {model_url}: {e}")
+        return await self._post_with_retries(model_url, input_data)
+
+    async def predict_many(
+        self,
+        batch_url: str,
+        inputs: List[Dict[str, Any]],
+        max_attempts: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Send many inputs in one request to a batch endpoint
+        Returns one output per input, in input order
+        """
+        outputs = await self._post_with_retries(batch_url, inputs, max_attempts)
+        if not isinstance(outputs, list) or len(outputs) != len(inputs):
+            raise ValueError(
+                f"Batch endpoint {batch_url} did not return one output per input"
+            )
+        return outputs
+
+    async def _post_with_retries(
+        self, model_url: str, payload: Any, max_attempts: Optional[int] = None
+    ) -> Any:
+        """POST a JSON payload, retrying timeouts, 429/503 and transport errors"""
+        client = get_http_client()
+        max_attempts = max_attempts or self.max_retries
+        for attempt in range(max_attempts):
+            last_attempt = attempt == max_attempts - 1
+            retry_after = None
+            try:
+                response = await client.post(
+                    model_url,
+                    json=payload,
+                    headers={"Content-Type": "application/json"},
+                )
+                response.raise_for_status()
+                result = response.json()
+                return result
+            except httpx.TimeoutException:
+                logger.warning(
+                    f"Timeout on attempt {attempt + 1}/{max_attempts} for {model_url}"
+                )
+                if last_attempt:
+                    raise
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                if status_code not in RETRYABLE_STATUS_CODES or last_attempt:
+                    logger.error(f"HTTP error {status_code} for {model_url}: {e}")
                     raise
-                except Exception as e:
-                    logger.error(f"Error calling model API {model_url}: {str(e)}")
-                    if attempt == self.max_retries - 1:
-                        raise
-                    continue
+                logger.warning(
+                    f"HTTP {status_code} on attempt {attempt + 1}/{max_attempts} for {model_url}"
+                )
+                retry_after = self._parse_retry_after(e.response)
+            except httpx.TransportError as e:
+                logger.error(f"Error calling model API {model_url}: {str(e)}")
+                if last_attempt:
+                    raise
+
+            await asyncio.sleep(self._retry_delay(attempt, retry_after))
 
         raise Exception("Failed to get prediction after all retries")
+
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before the next attempt"""
+        if retry_after is not None:
+            return min(retry_after, RETRY_AFTER_MAX)
+        backoff = RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, RETRY_BASE_DELAY)
+        return min(backoff, RETRY_MAX_DELAY)
+
+    @staticmethod
+    def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+        """Read a Retry-After header given in seconds, if present"""
+        value = response.headers.get("Retry-After")
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except ValueError:
+            # HTTP-date form; fall back to the regular backoff
+            return None
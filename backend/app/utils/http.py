@@ -0,0 +1,26 @@
+"""
+HTTP helpers for decoding request bodies and encoding responses with msgspec
+"""
+
+from typing import Any, Type, TypeVar
+import msgspec
+from fastapi import HTTPException, Request, Response
+
+StructT = TypeVar("StructT", bound=msgspec.Struct)
+
+
+async def decode_body(http_request: Request, body_type: Type[StructT]) -> StructT:
+    """Decode and validate a JSON request body, answering 422 on bad input"""
+    try:
+        return msgspec.json.decode(await http_request.body(), type=body_type)
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """Encode a response body with msgspec"""
+    return Response(
+        content=msgspec.json.encode(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -0,0 +1,39 @@
+"""
+ID generation - random UUIDs drawn from a pre-generated pool
+"""
+
+import os
+from collections import deque
+
+# One os.urandom call fills this many IDs, instead of one syscall and one
+# uuid.UUID object per ID
+UUID_POOL_SIZE = 256
+
+# Variant nibble for each possible random nibble: keep the low two bits and
+# set the top two to 10 (RFC 4122)
+_VARIANT_NIBBLES = "89ab" * 4
+
+_uuid_pool: deque = deque()
+
+# A forked child must not hand out the IDs its parent still holds
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _fill_uuid_pool() -> None:
+    """Generate a batch of version 4 UUID strings"""
+    h = os.urandom(16 * UUID_POOL_SIZE).hex()
+    _uuid_pool.extend(
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-4{h[i + 13:i + 16]}-"
+        f"{_VARIANT_NIBBLES[int(h[i + 16], 16)]}{h[i + 17:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, len(h), 32)
+    )
+
+
+def new_uuid() -> str:
+    """Return a random UUID string, formatted like str(uuid.uuid4())"""
+    try:
+        return _uuid_pool.popleft()
+    except IndexError:
+        _fill_uuid_pool()
+        return _uuid_pool.popleft()
@@ -2,25 +2,68 @@
 Logging utility for BiasScope Backend
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 from app.config import settings
 
+# Loggers only enqueue records; one background listener thread formats them
+# and writes to stdout, so a slow terminal or pipe never blocks a request.
+_stream_handler: Optional[logging.Handler] = None
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
 
-def setup_logger(name: str) -> logging.Logger:
-    """Setup logger with consistent formatting"""
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, settings.log_level.upper()))
 
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(logging.DEBUG)
+def _start_listener() -> None:
+    """Start a listener draining the queue handler's queue to stdout"""
+    global _listener
+    _listener = QueueListener(
+        _queue_handler.queue, _stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def _get_queue_handler() -> QueueHandler:
+    """Return the shared queue handler, starting the listener on first use"""
+    global _stream_handler, _queue_handler
+    if _queue_handler is None:
+        _stream_handler = logging.StreamHandler(sys.stdout)
+        _stream_handler.setLevel(logging.DEBUG)
 
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        _stream_handler.setFormatter(formatter)
+
+        _queue_handler = QueueHandler(queue.Queue(-1))
+        _start_listener()
+    return _queue_handler
+
+
+def _restart_after_fork() -> None:
+    """Give a forked child (e.g. a report worker) its own queue and listener"""
+    if _queue_handler is not None:
+        # The parent's listener thread does not survive the fork
+        _queue_handler.queue = queue.Queue(-1)
+        _start_listener()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def setup_logger(name: str) -> logging.Logger:
+    """Setup logger with consistent formatting"""
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, settings.log_level.upper()))
+
+    if not logger.handlers:
+        logger.addHandler(_get_queue_handler())
 
     return logger
@@ -2,19 +2,43 @@
 import sys
 import pymongo
 
+# Only the summary fields are fetched; results can be large, so the server
+# reports whether it is non-empty instead of sending it.
+CHECK_PROJECTION = {
+    'status': 1,
+    'report_generated': 1,
+    'report_path': 1,
+    'error_message': 1,
+    'results_present': {
+        '$gt': [{'$size': {'$objectToArray': {'$ifNull': ['$results', {}]}}}, 0]
+    },
+}
+
+# Creating a MongoClient starts monitor threads and discovers the topology,
+# so repeated checks from one process share a single client.
+_client = None
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        _client = pymongo.MongoClient('mongodb://localhost:27017', maxPoolSize=10)
+    return _client
+
+
 def check_analysis(analysis_id):
-    client = pymongo.MongoClient('mongodb://localhost:27017')
-    db = client['biasscope']
-    # Try both _id and analysis_id fields
-    analysis = db.analyses.find_one({'analysis_id': analysis_id})
-    if not analysis:
-        analysis = db.analyses.find_one({'_id': analysis_id})
+    db = _get_client()['biasscope']
+    # Try both _id and analysis_id fields in one round trip
+    analysis = db.analyses.find_one(
+        {'$or': [{'analysis_id': analysis_id}, {'_id': analysis_id}]},
+        CHECK_PROJECTION,
+    )
     if not analysis:
         print(f"Analysis not found: {analysis_id}")
         return
     print(f"Analysis ID: {analysis_id}")
     print(f"Status: {analysis.get('status')}")
-    print(f"Results present: {'results' in analysis and bool(analysis['results'])}")
+    print(f"Results present: {analysis.get('results_present', False)}")
     print(f"Report generated: {analysis.get('report_generated')}")
     print(f"Report path: {analysis.get('report_path')}")
     if 'error_message' in analysis:
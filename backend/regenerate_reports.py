@@ -3,10 +3,14 @@
 Utility script to regenerate PDF reports for all completed analyses
 """
 
+import argparse
 import asyncio
 import sys
 import os
 
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -16,18 +20,35 @@ from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# The listing only needs enough to decide what to regenerate; results are
+# loaded afterwards for the analyses that need them, and the large
+# synthetic_inputs / model_outputs arrays are never loaded at all.
+LISTING_PROJECTION = {"_id": 1, "report_generated": 1, "report_path": 1}
+RESULTS_PROJECTION = {"_id": 1, "results": 1}
+
+
+def report_is_missing(analysis):
+    """True if the analysis has no generated report file on disk"""
+    report_path = analysis.get("report_path")
+    return not (
+        analysis.get("report_generated") and report_path and os.path.exists(report_path)
+    )
+
 
-async def regenerate_reports():
+async def regenerate_reports(missing_only=False):
     """Regenerate PDF reports for all completed analyses"""
     try:
         db = await get_database()
         report_gen = ReportGenerator()
         
         # Get all completed analyses with results
-        cursor = db.analyses.find({
-            "status": "completed",
-            "results": {"$exists": True}
-        })
+        cursor = db.analyses.find(
+            {
+                "status": "completed",
+                "results": {"$type": "object"}
+            },
+            LISTING_PROJECTION,
+        )
         analyses = await cursor.to_list(None)
         
         if not analyses:
@@ -36,33 +57,67 @@ async def regenerate_reports():
         
         print(f"Found {len(analyses)} completed analyses\n")
         
+        if missing_only:
+            analyses = [analysis for analysis in analyses if report_is_missing(analysis)]
+            print(f"{len(analyses)} of them have no report on disk\n")
+            if not analyses:
+                return
+        
+        # Load results only for the analyses being regenerated
+        cursor = db.analyses.find(
+            {"_id": {"$in": [analysis['_id'] for analysis in analyses]}},
+            RESULTS_PROJECTION,
+        )
+        results_by_id = {doc['_id']: doc['results'] async for doc in cursor}
+        
         success_count = 0
         error_count = 0
         
-        for analysis in analyses:
+        # Render every report in parallel worker processes first
+        report_paths = await report_gen.generate_reports_batch(
+            [(analysis['_id'], results_by_id[analysis['_id']]) for analysis in analyses]
+        )
+        
+        # Then record every successful render in one unordered bulk write
+        outcomes = list(report_paths)
+        rendered = [
+            index for index, report_path in enumerate(outcomes)
+            if not isinstance(report_path, BaseException)
+        ]
+        operations = [
+            UpdateOne(
+                {"_id": analyses[index]['_id']},
+                {"$set": {
+                    "report_generated": True,
+                    "report_path": outcomes[index]
+                }}
+            )
+            for index in rendered
+        ]
+        if operations:
+            try:
+                await db.analyses.bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                # The other updates still applied; fail only the ones that errored
+                for write_error in e.details.get("writeErrors", []):
+                    outcomes[rendered[write_error["index"]]] = RuntimeError(
+                        write_error.get("errmsg", "update failed")
+                    )
+        
+        for analysis, outcome in zip(analyses, outcomes):
             analysis_id = analysis['_id']
             print(f"Processing: {analysis_id}")
             
-            try:
-                # Generate the PDF report
-                report_path = await report_gen.generate_report(analysis_id, analysis['results'])
-                
-                # Update the database with the report path
-                result = await db.analyses.update_one(
-                    {"_id": analysis_id},
-                    {"$set": {
-                        "report_generated": True,
-                        "report_path": report_path
-                    }}
+            if isinstance(outcome, BaseException):
+                print(f"  ✗ Error: {str(outcome)}")
+                error_count += 1
+                logger.error(
+                    f"Error generating report for {analysis_id}: {str(outcome)}",
+                    exc_info=outcome,
                 )
-                
-                print(f"  ✓ Report generated: {report_path}")
+            else:
+                print(f"  ✓ Report generated: {outcome}")
                 success_count += 1
-                
-            except Exception as e:
-                print(f"  ✗ Error: {str(e)}")
-                error_count += 1
-                logger.error(f"Error generating report for {analysis_id}: {str(e)}", exc_info=True)
         
         print(f"\n{'='*60}")
         print(f"Report Generation Complete!")
@@ -80,8 +135,16 @@ async def regenerate_reports():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate BiasScope PDF reports")
+    parser.add_argument(
+        "--missing-only",
+        action="store_true",
+        help="only regenerate reports that are not marked generated or whose file is gone",
+    )
+    args = parser.parse_args()
+    
     print("BiasScope Report Regeneration Utility")
     print("="*60)
     print()
     
-    asyncio.run(regenerate_reports())
+    asyncio.run(regenerate_reports(missing_only=args.missing_only))
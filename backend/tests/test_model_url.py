@@ -0,0 +1,56 @@
+"""
+Regression checks for model URL normalization
+
+Run from the backend directory with:
+    python -m unittest discover tests
+"""
+
+import unittest
+
+from app.routers.analysis import normalize_model_url
+
+ACCEPTED = [
+    ("http://localhost:5000/predict", "http://localhost:5000/predict"),
+    ("https://example.com/predict", "https://example.com/predict"),
+    ("HTTPS://Example.com/predict?v=1", "HTTPS://Example.com/predict?v=1"),
+    ("localhost:5000/predict", "http://localhost:5000/predict"),
+    ("127.0.0.1:8000/predict", "http://127.0.0.1:8000/predict"),
+    ("example.com/predict", "http://example.com/predict"),
+    ("  example.com  ", "http://example.com"),
+    ("http://[::1]:5000/predict", "http://[::1]:5000/predict"),
+    ("[::1]:5000/predict", "http://[::1]:5000/predict"),
+    ("httpbin.org/post", "http://httpbin.org/post"),
+]
+
+REJECTED = [
+    "",
+    "   ",
+    "ftp://example.com/model",
+    "javascript:alert(1)",
+    "mailto:a@b",
+    "https:/x",
+    "user:pw@host/p",
+    "http://user:pw@host/p",
+    "http://",
+    "localhost:50x0/predict",
+    "http:5000",
+    "HTTPS:443/predict",
+    "http://exa mple.com/predict",
+]
+
+
+class NormalizeModelUrlTest(unittest.TestCase):
+    def test_accepted(self):
+        for raw, expected in ACCEPTED:
+            with self.subTest(raw=raw):
+                self.assertEqual(normalize_model_url(raw), expected)
+
+    def test_rejected(self):
+        for raw in REJECTED:
+            with self.subTest(raw=raw):
+                with self.assertRaises(ValueError):
+                    normalize_model_url(raw)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,4 +9,10 @@ db.analyses.createIndex({ "status": 1 });
 db.analyses.createIndex({ "created_at": -1 });
 db.analyses.createIndex({ "model_url": 1 });
 
+// Create indexes for users collection
+db.users.createIndex({ "user_id": 1 }, { unique: true });
+// Case-insensitive, so "Alice@x.com" and "alice@x.com" are the same user
+db.users.createIndex({ "email": 1 }, { unique: true, collation: { locale: "en", strength: 2 } });
+db.users.createIndex({ "username": 1 }, { unique: true, collation: { locale: "en", strength: 2 } });
+
 print("Indexes created successfully for BiasScope database");
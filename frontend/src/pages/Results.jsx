@@ -23,6 +23,9 @@ import {
   Radar,
 } from 'recharts'
 
+// 'started' covers the window before synthetic data is stored
+const RUNNING_STATUSES = ['started', 'in_progress']
+
 const Results = () => {
   const { analysisId } = useParams()
   const [loading, setLoading] = useState(true)
@@ -36,7 +39,7 @@ const Results = () => {
         const response = await axios.get(`/api/analysis/${analysisId}`)
         setAnalysisData(response.data)
 
-        if (response.data.status === 'in_progress') {
+        if (RUNNING_STATUSES.includes(response.data.status)) {
           setProgress(response.data.progress || 0)
           // Poll for updates if still in progress
           const interval = setInterval(async () => {
@@ -44,7 +47,7 @@ const Results = () => {
               const update = await axios.get(`/api/analysis/${analysisId}`)
               setAnalysisData(update.data)
               setProgress(update.data.progress || 0)
-              if (update.data.status !== 'in_progress') {
+              if (!RUNNING_STATUSES.includes(update.data.status)) {
                 clearInterval(interval)
               }
             } catch (err) {
@@ -81,13 +84,11 @@ const Results = () => {
       if (userId && analysisData) {
         try {
           const reportUrl = `/results/${analysisId}`
-          await axios.post('/api/auth/save-analysis', null, {
-            params: {
-              user_id: userId,
-              analysis_id: analysisId,
-              model_url: analysisData.model_url,
-              report_url: reportUrl
-            }
+          await axios.post('/api/auth/save-analysis', {
+            user_id: userId,
+            analysis_id: analysisId,
+            model_url: analysisData.model_url,
+            report_url: reportUrl
           })
         } catch (err) {
           console.log('Note: Could not save to account, but report downloaded')
@@ -204,7 +205,7 @@ const Results = () => {
         )}
       </div>
 
-      {analysisData.status === 'in_progress' && (
+      {RUNNING_STATUSES.includes(analysisData.status) && (
         <div className="bg-white shadow-sm rounded-lg border border-gray-200 p-8 mb-6">
           <h2 className="text-xl font-semibold text-gray-900 mb-4">
             Analysis in Progress
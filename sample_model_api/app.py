@@ -1,5 +1,6 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
+import numpy as np
 from fastapi import FastAPI
 
 app = FastAPI(title="BiasScope Sample Model API", version="1.0.0")
@@ -34,3 +35,30 @@ async def predict(payload: Dict[str, Any]):
 
     return {"prediction": score, "label": label}
 
+
+def _column(rows: List[Dict[str, Any]], key: str) -> np.ndarray:
+    """One numeric feature across all rows, missing values as 0"""
+    return np.fromiter(
+        (float(row.get(key, 0) or 0) for row in rows), dtype=np.float64, count=len(rows)
+    )
+
+
+@app.post("/predict_batch")
+async def predict_batch(rows: List[Dict[str, Any]]):
+    """
+    Score many records in one call with the same formula as /predict.
+    Returns one /predict-style output per input row, in order.
+    """
+    score = (
+        0.15 * np.minimum(_column(rows, "age") / 80.0, 1.0)
+        + 0.45 * np.minimum(_column(rows, "income") / 100000.0, 1.0)
+        + 0.35 * np.minimum(_column(rows, "credit_score") / 850.0, 1.0)
+        + 0.05 * np.minimum(_column(rows, "experience_years") / 40.0, 1.0)
+    )
+    np.clip(score, 0.0, 1.0, out=score)
+    labels = np.where(score >= 0.55, "approved", "rejected")
+
+    return [
+        {"prediction": prediction, "label": label}
+        for prediction, label in zip(score.tolist(), labels.tolist())
+    ]